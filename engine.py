@@ -20,6 +20,11 @@ import unreal
 import os
 import sys
 
+libs_path = os.path.join(os.path.dirname(__file__), 'libs')
+if libs_path not in sys.path:
+    sys.path.insert(0, libs_path)
+import unreal_utils
+
 ###############################################################################################
 # The Shotgun Unreal engine
 
@@ -215,12 +220,23 @@ class UnrealEditorEngine(Engine):
         # When the context changes, you'll want to recreate the Shotgun menu
         # as the actions might have changed.
 
+        # Memoized Shotgun lookups belong to the old context.
+        unreal_utils.clear_sg_caches()
+
     def destroy_engine(self):
         """
         Stops watching scene events and tears down menu.
         """
         self.logger.debug("%s: Destroying tk-unreal engine...", self)
 
+        # Drop memoized Shotgun lookups (including the cached engine itself)
+        # so a reloaded engine does not operate on this destroyed one.
+        unreal_utils.clear_sg_caches()
+
+        # Remove the scratch AnimSequence used by FBX binding exports so it
+        # does not linger in /Game/__sg_tmp and end up saved with the project.
+        unreal_utils.delete_tmp_anim_sequence()
+
         # Close all Shotgun app dialogs that are still opened since
         # some apps do threads cleanup in their onClose event handler
         # Note that this function is called when the engine is restarted (through "Reload Engine and Apps")
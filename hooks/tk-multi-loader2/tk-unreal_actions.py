@@ -16,7 +16,8 @@ HookBaseClass = sgtk.get_hook_baseclass()
 
 from pathlib import Path
 libs_path = os.path.join(str(Path(__file__).parents[2]), 'libs')
-sys.path.insert(0, libs_path)
+if libs_path not in sys.path:
+    sys.path.insert(0, libs_path)
 import unreal_utils
 
 
@@ -13,7 +13,8 @@ import sgtk
 
 from pathlib import Path
 libs_path = os.path.join(str(Path(__file__).parents[3]), 'libs')
-sys.path.insert(0, libs_path)
+if libs_path not in sys.path:
+    sys.path.insert(0, libs_path)
 import unreal_utils
 
 
@@ -413,7 +414,7 @@ class UnrealSessionCollector(HookBaseClass):
         :param parent_item: Parent Item instance
         """
 
-        movies_dir = os.path.join(unreal_utils.PROJECT_ROOT, "render")
+        movies_dir = os.path.join(unreal_utils.project_root(), "render")
         unreal.log(f"Collect rendered movies from '{movies_dir}'...")
         for (dirpath, dirnames, filenames) in os.walk(movies_dir):
             # filenames = (os.path.join(dirpath, f) for f in filenames)
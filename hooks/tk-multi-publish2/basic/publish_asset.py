@@ -10,7 +10,8 @@ import datetime
 
 from pathlib import Path
 libs_path = os.path.join(str(Path(__file__).parents[3]), 'libs')
-sys.path.insert(0, libs_path)
+if libs_path not in sys.path:
+    sys.path.insert(0, libs_path)
 import unreal_utils
 
 # Local storage path field for known Oses.
@@ -135,20 +136,21 @@ class UnrealAssetPublishPlugin(HookBaseClass):
 
         # Unreal setttings
         settings_frame.unreal_publish_folder_label = QtGui.QLabel("Publish folder:")
+        # Bind the storage field name to a local, it is read several times
+        # per storage root in the loop below.
+        path_field = _OS_LOCAL_STORAGE_PATH_FIELD
         storage_roots = self.parent.shotgun.find(
             "LocalStorage",
             [],
-            ["code", _OS_LOCAL_STORAGE_PATH_FIELD]
+            ["code", path_field]
         )
         settings_frame.storage_roots_widget = QtGui.QComboBox()
         settings_frame.storage_roots_widget.addItem("Current Unreal Project")
         for storage_root in storage_roots:
-            if storage_root[_OS_LOCAL_STORAGE_PATH_FIELD]:
+            storage_path = storage_root[path_field]
+            if storage_path:
                 settings_frame.storage_roots_widget.addItem(
-                    "%s (%s)" % (
-                        storage_root["code"],
-                        storage_root[_OS_LOCAL_STORAGE_PATH_FIELD]
-                    ),
+                    "%s (%s)" % (storage_root["code"], storage_path),
                     userData=storage_root,
                 )
         # Create the layout to use within the QFrame
@@ -211,9 +213,10 @@ class UnrealAssetPublishPlugin(HookBaseClass):
         folder_index = 0
         publish_folder = cur_settings["Publish Folder"]
         if publish_folder:
+            path_field = _OS_LOCAL_STORAGE_PATH_FIELD
             for i in range(widget.storage_roots_widget.count()):
                 data = widget.storage_roots_widget.itemData(i, role=QtCore.Qt.UserRole)
-                if data and data[_OS_LOCAL_STORAGE_PATH_FIELD] == publish_folder:
+                if data and data[path_field] == publish_folder:
                     folder_index = i
                     break
             self.logger.debug("Index for %s is %s" % (publish_folder, folder_index))
@@ -5,10 +5,10 @@
 import sgtk
 import unreal
 import shutil
-from tank_vendor import six
 
 import copy
 import datetime
+import logging
 import os
 import pprint
 import subprocess
@@ -18,10 +18,14 @@ import tempfile
 
 from pathlib import Path
 libs_path = os.path.join(str(Path(__file__).parents[3]), 'libs')
-sys.path.insert(0, libs_path)
+if libs_path not in sys.path:
+    sys.path.insert(0, libs_path)
 import unreal_utils
 
 
+# Movie publishing is only supported on Windows.
+_IS_WIN = sys.platform == "win32"
+
 # Local storage path field for known Oses.
 _OS_LOCAL_STORAGE_PATH_FIELD = {
     "darwin": "mac_path",
@@ -161,20 +165,21 @@ class UnrealMoviePublishPlugin(HookBaseClass):
             settings_frame.unreal_render_presets_widget.addItem(preset.split(".")[0])
 
         settings_frame.unreal_publish_folder_label = QtGui.QLabel("Publish folder:")
+        # Bind the storage field name to a local, it is read several times
+        # per storage root in the loop below.
+        path_field = _OS_LOCAL_STORAGE_PATH_FIELD
         storage_roots = self.parent.shotgun.find(
             "LocalStorage",
             [],
-            ["code", _OS_LOCAL_STORAGE_PATH_FIELD]
+            ["code", path_field]
         )
         settings_frame.storage_roots_widget = QtGui.QComboBox()
         settings_frame.storage_roots_widget.addItem("Current Unreal Project")
         for storage_root in storage_roots:
-            if storage_root[_OS_LOCAL_STORAGE_PATH_FIELD]:
+            storage_path = storage_root[path_field]
+            if storage_path:
                 settings_frame.storage_roots_widget.addItem(
-                    "%s (%s)" % (
-                        storage_root["code"],
-                        storage_root[_OS_LOCAL_STORAGE_PATH_FIELD]
-                    ),
+                    "%s (%s)" % (storage_root["code"], storage_path),
                     userData=storage_root,
                 )
         # Create the layout to use within the QFrame
@@ -204,7 +209,7 @@ class UnrealMoviePublishPlugin(HookBaseClass):
         # settings which are editable in the UI.
         render_presets_path = None
         if widget.unreal_render_presets_widget.currentIndex() > 0:  # First entry is "No Presets"
-            render_presets_path = six.ensure_str(widget.unreal_render_presets_widget.currentText())
+            render_presets_path = widget.unreal_render_presets_widget.currentText()
         storage_index = widget.storage_roots_widget.currentIndex()
         publish_folder = None
         if storage_index > 0:  # Something selected and not the first entry
@@ -249,9 +254,10 @@ class UnrealMoviePublishPlugin(HookBaseClass):
         folder_index = 0
         publish_folder = cur_settings["Publish Folder"]
         if publish_folder:
+            path_field = _OS_LOCAL_STORAGE_PATH_FIELD
             for i in range(widget.storage_roots_widget.count()):
                 data = widget.storage_roots_widget.itemData(i, role=QtCore.Qt.UserRole)
-                if data and data[_OS_LOCAL_STORAGE_PATH_FIELD] == publish_folder:
+                if data and data[path_field] == publish_folder:
                     folder_index = i
                     break
             self.logger.debug("Index for %s is %s" % (publish_folder, folder_index))
@@ -326,10 +332,7 @@ class UnrealMoviePublishPlugin(HookBaseClass):
         :returns: dictionary with boolean keys accepted, required and enabled
         """
 
-        accepted = True
-        checked = True
-
-        if sys.platform != "win32":
+        if not _IS_WIN:
             self.logger.warning(
                 "Movie publishing is not supported on other platforms than Windows..."
             )
@@ -337,6 +340,9 @@ class UnrealMoviePublishPlugin(HookBaseClass):
                 "accepted": False,
             }
 
+        accepted = True
+        checked = True
+
         publisher = self.parent
 
         item.context = item.properties["context"]
@@ -449,7 +455,8 @@ class UnrealMoviePublishPlugin(HookBaseClass):
         movie_path = item.properties.get("movie_path")
         is_exr_seq = os.path.isdir(movie_path)
 
-        publish_path = os.path.normpath(item.properties["publish_path"])
+        # The path was already normalized in accept().
+        publish_path = item.properties["publish_path"]
 
         # Split the destination path into folder and filename
         destination_folder, movie_name = os.path.split(publish_path)
@@ -491,19 +498,21 @@ class UnrealMoviePublishPlugin(HookBaseClass):
         if publish_data:
             version_data["published_files"] = [publish_data]
 
-        # Log the version data for debugging
-        self.logger.debug(
-            "Populated Version data...",
-            extra={
-                "action_show_more_info": {
-                    "label": "Version Data",
-                    "tooltip": "Show the complete Version data dictionary",
-                    "text": "<pre>%s</pre>" % (
-                        pprint.pformat(version_data),
-                    )
+        # Log the version data for debugging. pformat is expensive, only
+        # build the detail pane when debug logging is enabled.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Populated Version data...",
+                extra={
+                    "action_show_more_info": {
+                        "label": "Version Data",
+                        "tooltip": "Show the complete Version data dictionary",
+                        "text": "<pre>%s</pre>" % (
+                            pprint.pformat(version_data),
+                        )
+                    }
                 }
-            }
-        )
+            )
 
         # Create the version
         self.logger.info("Creating version for review...")
@@ -1,35 +1,128 @@
 import unreal
 import os
+import re
 import sys
-import glob
+import heapq
+import fnmatch
+import functools
+import time
 import subprocess
+import concurrent.futures
 import shutil
+import threading
+from collections import deque
 from PySide6.QtWidgets import QApplication, QMessageBox
+from shiboken6 import isValid as _qt_is_valid
 
 SHOT_SEQUENCE_START = 1001
-PROJECT_ROOT = os.path.normpath(unreal.SystemLibrary.get_project_directory())
+
+
+@functools.lru_cache(maxsize=1)
+def project_root():
+    return os.path.normpath(unreal.SystemLibrary.get_project_directory())
+
+
+# Spawn/transform constants, allocated once instead of per spawn call.
+# The editor copies them into the actor transform, so reuse is safe.
+_V_ZERO = unreal.Vector(0, 0, 0)
+_R_ZERO = unreal.Rotator(0, 0, 0)
+_V_VDB_SCALE = unreal.Vector(100.0, 100.0, 100.0)
+_R_VDB_ROT = unreal.Rotator(-90.0, 0.0, 0.0)
+
+# Enum members resolved once; each inline reference walks the generated
+# bindings' attribute lookup.
+_KEEP_STATE = unreal.MovieSceneCompletionMode.KEEP_STATE
+_KEY_LINEAR = unreal.MovieSceneKeyInterpolation.LINEAR
+_ABC_GEOM_CACHE = unreal.AlembicImportType.GEOMETRY_CACHE
+
+
+@functools.lru_cache(maxsize=1)
+def _asset_tools():
+    return unreal.AssetToolsHelpers.get_asset_tools()
+
+
+@functools.lru_cache(maxsize=None)
+def _subsys(cls):
+    # Subsystem pointers are process-stable, one C++ crossing per class
+    return unreal.get_editor_subsystem(cls)
+
+
+def _level_editor_subsystem():
+    return _subsys(unreal.LevelEditorSubsystem)
+
+
+def _editor_actor_subsystem():
+    return _subsys(unreal.EditorActorSubsystem)
+
+
+def _editor_world():
+    # The world object changes on level load, only the subsystem is cached
+    return _subsys(unreal.UnrealEditorSubsystem).get_editor_world()
+
+
+@functools.lru_cache(maxsize=1)
+def _engine():
+    import sgtk
+    return sgtk.platform.current_engine()
+
+
+# Reused across calls; building a QMessageBox redoes style and layout
+# work each time and leaks without a parent.
+_msg_box = None
 
 
 def msg_box(title, text, buttons=QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel):
-    msg = QMessageBox()
-    msg.setIcon(QMessageBox.Icon.Warning)
-    msg.setWindowTitle(title)
-    msg.setText(text)
-    msg.setStandardButtons(buttons)
-    return msg.exec()  # QMessageBox.Ok, QMessageBox.Cancel
+    global _msg_box
+    if QApplication.instance() is None:
+        # Headless commandlet, nobody can click anything
+        return QMessageBox.StandardButton.Ignore
+    # Qt deletes the box with its parent window (e.g. a closed publish
+    # dialog); rebuild when the cached wrapper points at a dead object.
+    if _msg_box is None or not _qt_is_valid(_msg_box):
+        _msg_box = QMessageBox(parent=QApplication.activeWindow())
+        _msg_box.setIcon(QMessageBox.Icon.Warning)
+    _msg_box.setWindowTitle(title)
+    _msg_box.setText(text)
+    _msg_box.setStandardButtons(buttons)
+    return _msg_box.exec()  # QMessageBox.Ok, QMessageBox.Cancel
+
+
+# Short-lived {(entity_type, id, fields): (timestamp, row)} cache so
+# collector passes that read the same entity fields over and over only
+# pay one round-trip per TTL window.
+_sg_cache = {}
+
+
+def _sg_find_one_cached(sg, entity_type, entity_id, fields, ttl=60):
+    key = (entity_type, entity_id, tuple(fields))
+    hit = _sg_cache.get(key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    data = sg.find_one(entity_type, [["id", "is", entity_id]], list(fields))
+    _sg_cache[key] = (now, data)
+    return data
+
+
+def _invalidate_sg_cache(entity_type=None, entity_id=None):
+    if entity_type is None:
+        _sg_cache.clear()
+        return
+    stale = [k for k in _sg_cache
+             if k[0] == entity_type and (entity_id is None or k[1] == entity_id)]
+    for key in stale:
+        del _sg_cache[key]
 
 
 def entity_field_values(name, default=None, context=None):
-    import sgtk
-    en = sgtk.platform.current_engine()
+    en = _engine()
     ctx = context if context else en.context
     sg = en.shotgun
 
     entity_type = ctx.entity['type']
     entity_id = ctx.entity['id']
 
-    field_val = sg.find_one(
-        entity_type, [["id", "is", entity_id]], [name])
+    field_val = _sg_find_one_cached(sg, entity_type, entity_id, [name])
     if field_val:
         field_val = field_val.get(name, default)
     if field_val is None:
@@ -44,8 +137,7 @@ def frame_range_sync(seq, ctx):
             return default
         return val
 
-    import sgtk
-    en = sgtk.platform.current_engine()
+    en = _engine()
     sg = en.shotgun
     entity_type = ctx.entity['type']
     entity_id = ctx.entity['id']
@@ -69,8 +161,7 @@ def frame_range_sync(seq, ctx):
 
 
 def update_status():
-    import sgtk
-    en = sgtk.platform.current_engine()
+    en = _engine()
     ctx = en.context
     sg = en.shotgun
 
@@ -84,23 +175,28 @@ def update_status():
     new_status = 'rev'
     try:
         sg.update("Task", ctx.task['id'], {'sg_status_list': new_status})
+        _invalidate_sg_cache("Task", ctx.task['id'])
     except:
         sys.stderr.write(
             "WARNING: Can't update task status to '{0}' from this user.\n".format(new_status))
 
 
+@functools.lru_cache(maxsize=1)
 def tk_root():
-    import sgtk
-    en = sgtk.platform.current_engine()
+    en = _engine()
     ctx = en.context
     root = os.path.dirname(ctx.sgtk.roots.get('primary'))
     return os.path.join(root, 'playsense-cgi-tk')
 
 
-scripts_path = os.path.join(tk_root(), "scripts")
-sys.path.insert(0, scripts_path)
+@functools.lru_cache(maxsize=1)
+def _ensure_scripts_path():
+    # Deferred so importing this module doesn't force an engine lookup.
+    sys.path.insert(0, os.path.join(tk_root(), "scripts"))
+    return True
 
 
+@functools.lru_cache(maxsize=1)
 def ffmpeg_path():
     ffmpeg = os.path.join(tk_root(), 'app', 'Windows', 'ffmpeg', 'bin', 'ffmpeg.exe')
     if not os.path.isfile(ffmpeg):
@@ -109,17 +205,12 @@ def ffmpeg_path():
     return ffmpeg
 
 
-FFMPEG_PATH = ffmpeg_path()
-
-
 def project_field_value(name, default=None, context=None):
-    import sgtk
-    en = sgtk.platform.current_engine()
+    en = _engine()
     ctx = context if context else en.context
     sg = en.shotgun
 
-    field_val = sg.find_one(
-        "Project", [["id", "is", ctx.project['id']]], [name])
+    field_val = _sg_find_one_cached(sg, "Project", ctx.project['id'], [name])
     if field_val:
         field_val = field_val.get(name, default)
     if field_val is None:
@@ -129,64 +220,228 @@ def project_field_value(name, default=None, context=None):
 
 def find_first_seuence_file(seq_dir_path, ext='.exr'):
     dirname = os.path.basename(seq_dir_path)
-    for (_, _, filenames) in os.walk(seq_dir_path):
-        for f in filenames:
-            basename, _ext = os.path.splitext(f)
+    try:
+        entries = os.scandir(seq_dir_path)
+    except OSError:
+        return
+    # One readdir of the sequence dir itself; os.walk set up a whole
+    # tree traversal (with a stat per entry) just to read the top level.
+    with entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            f = entry.name
+            dot = f.rfind('.')
+            _ext = f[dot:] if dot > 0 else ''
             if _ext.lower() != ext:
                 unreal.log(f"SG Publish collector: ignore not '{ext}' seqence dir '{seq_dir_path}'")
                 return
             if not f.startswith(dirname):
                 unreal.log(f"SG Publish collector: ignore non-conventional EXR seqence dir '{seq_dir_path}'")
                 return
-            return os.path.join(seq_dir_path, f)
-        unreal.log(f"SG Publish collector: ignore empty dir '{seq_dir_path}'")
-        return
+            return entry.path
+    unreal.log(f"SG Publish collector: ignore empty dir '{seq_dir_path}'")
     return
 
 
 def filename_as_sequence_pattern(filename):
-    splitted = filename.split('.')
-    frame = splitted[-2]
-    iframe = int(frame)
-    splitted[-2] = "#" * len(frame)
-    return '.'.join(splitted)
+    # Only the frame segment between the last two dots changes; slicing
+    # around it skips the split/join list churn.
+    dot2 = filename.rfind('.')
+    dot1 = filename.rfind('.', 0, dot2)
+    return f"{filename[:dot1 + 1]}{'#' * (dot2 - dot1 - 1)}{filename[dot2:]}"
+
+
+@functools.lru_cache(maxsize=1)
+def _ffprobe_path():
+    # ffprobe ships next to ffmpeg
+    ffmpeg = ffmpeg_path()
+    if not ffmpeg:
+        return None
+    head, tail = os.path.split(ffmpeg)
+    ffprobe = os.path.join(head, tail.replace('ffmpeg', 'ffprobe'))
+    if not os.path.isfile(ffprobe):
+        ffprobe = shutil.which("ffprobe")
+    return ffprobe
 
 
-def convert_mov_to_mp4(src, dst):
-    commands = [
-        FFMPEG_PATH,
-        "-i",
-        src,
-        "-vcodec",
-        "libx264",
-        "-acodec",
-        "libfaac",
-        "-pix_fmt",
-        "yuv420p",
+def _mov_is_stream_copyable(src):
+    ffprobe = _ffprobe_path()
+    if not ffprobe:
+        return False
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "stream=codec_name,pix_fmt", "-of", "csv=p=0", src],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    if result.returncode != 0:
+        return False
+    fields = result.stdout.strip().split(',')
+    return len(fields) >= 2 and fields[0] == 'h264' and fields[1] == 'yuv420p'
+
+
+def _mov_to_mp4_commands(src, dst):
+    if _mov_is_stream_copyable(src):
+        # The MOV already holds yuv420p H.264, remux instead of the
+        # 10-50x slower decode/encode round-trip.
+        return [
+            ffmpeg_path(),
+            "-i", src,
+            "-c:v", "copy",
+            "-c:a", "aac",
+            "-movflags", "+faststart",
+            dst,
+        ]
+    return [
+        ffmpeg_path(),
+        "-i", src,
+        "-vcodec", "libx264",
+        "-acodec", "aac",
+        "-pix_fmt", "yuv420p",
+        "-preset", "veryfast",
+        "-threads", "0",
         dst,
     ]
 
-    if subprocess.run(commands).returncode == 0:
+
+def convert_mov_to_mp4(src, dst):
+    # Swallow the progress spam so the editor log isn't flooded and the
+    # pipe never blocks; keep stderr for the failure message.
+    result = subprocess.run(_mov_to_mp4_commands(src, dst),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode == 0:
         print("FFmpeg Script Ran Successfully")
         return True
     else:
         print("There was an error running your FFmpeg script")
+        if result.stderr:
+            sys.stderr.write(result.stderr.decode(errors='replace'))
         return False
 
 
+def convert_mov_to_mp4_async(src, dst):
+    """
+    Start a MOV conversion without blocking the caller
+
+    :returns: The ffmpeg subprocess.Popen; wait() or poll() it to
+              collect the result
+    """
+    # Discard stderr too: nobody drains the pipe, and ffmpeg's progress
+    # output would fill it and deadlock wait() on long encodes.
+    return subprocess.Popen(_mov_to_mp4_commands(src, dst),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _convert_one(src, dst):
+    # One error contract for the batch: a failed pair is False, never an
+    # exception that would discard the other pairs' results.
+    try:
+        if os.path.splitext(src)[1].lower() == ".exr" or os.path.isdir(src):
+            convert_exr_seq_to_mp4(src, dst)
+            return True
+        return convert_mov_to_mp4(src, dst)
+    except Exception as e:
+        sys.stderr.write("Failed to convert '{0}': {1}\n".format(src, e))
+        return False
+
+
+def convert_many(pairs):
+    """
+    Convert several sources to MP4 concurrently
+
+    MOV sources are transcoded with convert_mov_to_mp4, EXR sequences
+    (a .exr path or a directory) with convert_exr_seq_to_mp4.
+
+    :param pairs: A list of (src, dst) tuples
+    :returns: A list of per-pair success flags, in input order
+    """
+    if not pairs:
+        return []
+    # ffmpeg itself is multi-threaded, half the cores keeps the editor
+    # responsive while the conversions run
+    workers = min(len(pairs), max(1, (os.cpu_count() or 2) // 2))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_convert_one, src, dst) for src, dst in pairs]
+        return [f.result() for f in futures]
+
+
+def convert_mov_to_mp4_batch(pairs):
+    """
+    Convert several MOVs concurrently
+
+    :param pairs: A list of (src, dst) tuples
+    :returns: A list of per-pair success flags, in input order
+    """
+    return convert_many(pairs)
+
+
 def convert_exr_seq_to_mp4(src, dst, fromspace='ACES - ACEScg', fps=30):
+    _ensure_scripts_path()
     import seq2mov
     seq2mov.convert(filename=src, out_filename=dst, fromspace=fromspace, fps=fps)
 
 
-def last_versions(filenames, pattern="???.mov"):
+# {dirpath: (timestamp, names)} — a publish pass hits the same version
+# directories from last_versions and cleanup_versions back to back, a
+# short TTL lets them share one readdir.
+_dir_cache = {}
+
+
+def _list_dir_cached(dirpath, ttl=5):
+    hit = _dir_cache.get(dirpath)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    try:
+        names = os.listdir(dirpath or '.')
+    except OSError:
+        names = None
+    _dir_cache[dirpath] = (now, names)
+    return names
+
+
+def last_versions(filenames, pattern="???.mov", source=None):
+    if source is not None:
+        # The caller already has a listing, reduce it in one pass
+        # instead of re-scanning the disk per prefix.
+        prefixes = set(f[:-len(pattern)] for f in filenames)
+        best = {}
+        for f in source:
+            prefix = f[:-len(pattern)]
+            if prefix in prefixes and fnmatch.fnmatch(f[-len(pattern):], pattern):
+                key = f.lower()
+                if key > best.get(prefix, ('', ''))[0]:
+                    best[prefix] = (key, f)
+        return [f for _, f in best.values()]
+
     _filenames = set(f[:-len(pattern)] + pattern for f in filenames)
-    files = []
+
+    # Group the patterns by directory: one scandir pass per directory
+    # with precompiled matchers instead of a glob walk (and a full sort
+    # just to take the last element) per pattern.
+    by_dir = {}
     for f in _filenames:
-        l = sorted(glob.iglob(f))
-        if not l:
+        dirname, basename = os.path.split(f)
+        # normcase both sides like fnmatch.fnmatch does, so matching stays
+        # case-insensitive on Windows as it was with glob.
+        by_dir.setdefault(dirname, []).append(
+            re.compile(fnmatch.translate(os.path.normcase(basename))))
+
+    files = []
+    for dirname, matchers in by_dir.items():
+        # (lowercased, original) pairs: case-folded comparison so the
+        # pick doesn't depend on the platform's directory order or the
+        # case convention of the artist who saved the file.
+        best = [None] * len(matchers)
+        names = _list_dir_cached(dirname)
+        if names is None:
             continue
-        files.append(l[-1])
+        for name in names:
+            key = name.lower()
+            cased = os.path.normcase(name)
+            for i, matcher in enumerate(matchers):
+                if matcher.match(cased) and (best[i] is None or key > best[i][0]):
+                    best[i] = (key, name)
+        files.extend(os.path.join(dirname, pair[1]) for pair in best if pair is not None)
 
     return files
 
@@ -197,68 +452,202 @@ def cleanup_versions(filepath, pattern="???.abc", max_versions=5, logger=None):
         return
 
     pattern = filepath[:-len(pattern)] + pattern
+    dirname, basename = os.path.split(pattern)
+    names = _list_dir_cached(dirname)
+    if names is None:
+        return
+    matches = [os.path.join(dirname, n) for n in names if fnmatch.fnmatch(n, basename)]
+    excess = len(matches) - max_versions
+    if excess <= 0:
+        return
+
     files = []
-    for f in sorted(glob.iglob(pattern))[:-max_versions]:
+    # Partial selection of the oldest versions, no full sort
+    for f in heapq.nsmallest(excess, matches):
         try:
             os.remove(f)
-            files.append()
+            files.append(f)
             if logger:
                 logger.info(
                     "Remove '{0}' because of version limit = {1}".format(f, max_versions))
-        except:
+        except OSError:
             if logger:
                 logger.info("Can't remove '{0}'".format(f))
 
+    if files:
+        # The cached listing is stale now
+        _dir_cache.pop(dirname, None)
+
+
+# Per-sequence {display_name: object} indexes keyed by the sequence path
+# name. Unreal objects aren't hashable, so the path string is the key.
+# Code that adds tracks/possessables must call _invalidate_seq_cache().
+_track_cache = {}
+_possessable_cache = {}
+_spawnable_cache = {}
+_binding_cache = {}
+
+
+def _invalidate_seq_cache(seq):
+    key = seq.get_path_name()
+    _track_cache.pop(key, None)
+    _possessable_cache.pop(key, None)
+    _spawnable_cache.pop(key, None)
+    _binding_cache.pop(key, None)
+
+
+def _bindings_by_name(sequence, key=None):
+    if key is None:
+        key = sequence.get_path_name()
+    index = _binding_cache.get(key)
+    if index is None:
+        index = {str(b.get_name()): b for b in sequence.get_bindings()}
+        _binding_cache[key] = index
+    return index
+
 
 def find_track(sequence, track_name):
-    for track in sequence.get_tracks():
-        if track.get_display_name() == track_name:
-            return track
-    return None
+    key = sequence.get_path_name()
+    index = _track_cache.get(key)
+    if index is None:
+        index = {str(t.get_display_name()): t for t in sequence.get_tracks()}
+        _track_cache[key] = index
+    return index.get(track_name)
 
 
 def find_possessable(sequence, actor_name):
-    for track in sequence.get_possessables():
-        if track.get_display_name() == actor_name:
-            return track
-    return None
+    key = sequence.get_path_name()
+    index = _possessable_cache.get(key)
+    if index is None:
+        index = {str(p.get_display_name()): p for p in sequence.get_possessables()}
+        _possessable_cache[key] = index
+    return index.get(actor_name)
 
 
 def find_spawnables(sequence, actor_name):
-    for track in sequence.get_spawnables():
-        if track.get_display_name() == actor_name:
-            return track
-    return None
+    key = sequence.get_path_name()
+    index = _spawnable_cache.get(key)
+    if index is None:
+        index = {str(s.get_display_name()): s for s in sequence.get_spawnables()}
+        _spawnable_cache[key] = index
+    return index.get(actor_name)
+
+
+# {world path: (timestamp, {label: actor})} index built from one
+# get_all_level_actors pass, so repeated find_actor calls don't rescan
+# the level. Spawning or destroying actors must call
+# _invalidate_actor_cache(); a short TTL bounds staleness from edits
+# this module never sees (user deletes/renames, other tools).
+_actor_cache = {}
+_ACTOR_CACHE_TTL = 5
+
+
+def _invalidate_actor_cache():
+    _actor_cache.clear()
+
+
+# Loaded level-sequence assets keyed by content path. load_asset goes
+# through the Asset Registry every call; shots importing many caches
+# reuse the same sequence object instead.
+_seq_asset_cache = {}
+
+
+def _load_seq(seq_path):
+    seq = _seq_asset_cache.get(seq_path)
+    # UObject wrappers have no is_valid() method; go through SystemLibrary
+    if seq is None or not unreal.SystemLibrary.is_valid(seq):
+        seq = unreal.load_asset(seq_path)
+        _seq_asset_cache[seq_path] = seq
+    return seq
+
+
+def _load_level(level_path):
+    # A reload costs seconds; skip it when the level is already open.
+    # The world path is package.object, compare the package part only.
+    world = _editor_world()
+    if world and world.get_path_name().partition('.')[0] == level_path:
+        return True
+
+    # Loading a level swaps the editor world, drop the stale actor index
+    _invalidate_actor_cache()
+    return _level_editor_subsystem().load_level(level_path)
 
 
 def find_actor(actor_name, actor_class=unreal.GeometryCacheActor):
     # Check if an actor with the same name already exists in the level
-    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
-    for actor in unreal.GameplayStatics.get_all_actors_of_class(world, actor_class):
-        if actor.get_actor_label() == actor_name:
-            return actor
-    return None
+    world = _editor_world()
+    key = world.get_path_name()
+    hit = _actor_cache.get(key)
+    now = time.monotonic()
+    if hit is None or now - hit[0] >= _ACTOR_CACHE_TTL:
+        # One C++ traversal covers every later lookup whatever the class
+        index = {a.get_actor_label(): a for a in _editor_actor_subsystem().get_all_level_actors()}
+        _actor_cache[key] = (now, index)
+    else:
+        index = hit[1]
+    actor = index.get(actor_name)
+    if actor is not None and not unreal.SystemLibrary.is_valid(actor):
+        # Deleted outside this module within the TTL window: rescan
+        index = {a.get_actor_label(): a for a in _editor_actor_subsystem().get_all_level_actors()}
+        _actor_cache[key] = (time.monotonic(), index)
+        actor = index.get(actor_name)
+    if actor is not None and actor_class is not None:
+        if isinstance(actor_class, unreal.Class):
+            # Callers may pass a UClass (as get_all_actors_of_class took)
+            if not actor.get_class().is_child_of(actor_class):
+                return None
+        elif not isinstance(actor, actor_class):
+            return None
+    return actor
+
+
+# Sub-sequences only hang off sub tracks (shot tracks subclass them);
+# filtering on the track type skips the section probing for everything
+# else. Guarded for API versions without the class exposed.
+_SUB_TRACK_TYPE = getattr(unreal, 'MovieSceneSubTrack', None)
 
 
 def find_actor_sequence_binding(seq, actor_name):
     if not seq:
         return
 
-    def walk(seq):
-        for b in seq.get_bindings():
-            # unreal.log(f"NAME: {b.get_name()}  {actor_name}")
-            if b.get_name() == actor_name:
+    # Breadth-first walk with a visited set: shallow bindings are found
+    # before deep ones, shared sub-sequences are only scanned once and a
+    # cyclic sub-sequence graph can't loop forever.
+    queue = deque([seq])
+    seen = set()
+    while queue:
+        s = queue.popleft()
+        key = s.get_path_name()
+        if key in seen:
+            continue
+        seen.add(key)
+
+        # Prefer the native lookup when the installed API exposes it:
+        # one C++ call instead of a Python loop over every binding.
+        find_binding = getattr(s, 'find_binding_by_name', None)
+        if find_binding is not None:
+            b = find_binding(actor_name)
+            if b and b.is_valid():
+                return b
+        else:
+            b = _bindings_by_name(s, key).get(actor_name)
+            if b is not None:
                 return b
 
-        for track in seq.get_tracks():
+        for track in s.get_tracks():
+            if _SUB_TRACK_TYPE is not None and not isinstance(track, _SUB_TRACK_TYPE):
+                continue
             for section in track.get_sections():
-                try:
-                    b = walk(section.get_sequence())
-                    if b:
-                        return b
-                except:
-                    pass
-    return walk(seq)
+                # Only sub-sections expose get_sequence; cheaper than
+                # raising AttributeError for every other section type.
+                get_sequence = getattr(section, 'get_sequence', None)
+                if get_sequence is None:
+                    continue
+                sub_seq = get_sequence()
+                if sub_seq:
+                    queue.append(sub_seq)
+    return None
 
 
 def get_bound_actors(bindings):
@@ -279,15 +668,32 @@ def get_bound_actor(binding):
     return None
 
 
+# Learned {(class name, property name): bool} validity map. The Python
+# API has no cheap way to list editor properties per class, so validity
+# is discovered on the first access and known misses are skipped without
+# paying the exception cost again.
+_prop_valid = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _warn_missing_property(class_name, propname):
+    unreal.log_warning(f"'{class_name}' has no editor property '{propname}'")
+
+
 def get_properties(objects, props):
     data = {}
     for o in objects:
+        cls = type(o).__name__
         props_dict = {}
         for propname in props:
+            if _prop_valid.get((cls, propname)) is False:
+                continue
             try:
                 props_dict[propname] = o.get_editor_property(propname)
-            except:
-                pass
+                _prop_valid[(cls, propname)] = True
+            except Exception:
+                _prop_valid[(cls, propname)] = False
+                _warn_missing_property(cls, propname)
         data[o] = props_dict
     return data
 
@@ -295,44 +701,59 @@ def get_properties(objects, props):
 def set_properties(objects, props):
     for o in objects:
         name = o.get_actor_label()
+        cls = type(o).__name__
         for propname, value in props.items():
+            if _prop_valid.get((cls, propname)) is False:
+                continue
             try:
                 o.set_editor_property(propname, value)
+                _prop_valid[(cls, propname)] = True
                 unreal.log(f"Set '{name}' property '{propname}' to '{value}'")
-            except:
-                pass
+            except Exception:
+                _prop_valid[(cls, propname)] = False
+                _warn_missing_property(cls, propname)
 
 
 def restore_properties(props_data):
     for o, props in props_data.items():
         name = o.get_actor_label()
+        cls = type(o).__name__
         for propname, value in props.items():
+            if _prop_valid.get((cls, propname)) is False:
+                continue
             try:
                 o.set_editor_property(propname, value)
                 unreal.log(f"Set '{name}' property '{propname}' to '{value}'")
-            except:
-                pass
+            except Exception:
+                _warn_missing_property(cls, propname)
 
 
 def save_active_state(bindings):
-    data = {
-        binding: {
-            track: [
-                (section, section.is_active())
-                for section in track.get_sections()
-            ]
-            for track in binding.get_tracks()
-        }
-        for binding in bindings
-    }
-    return data
+    """
+    Snapshot the active flag of every section under the given bindings
+
+    Returns flat parallel 'sections'/'flags' lists for the restore pass
+    plus the set of tracks each binding had at save time, which
+    restore_state_after_bake diffs to spot tracks added by the bake.
+    """
+    sections = []
+    flags = []
+    tracks = {}
+    for binding in bindings:
+        binding_tracks = binding.get_tracks()
+        tracks[binding] = set(binding_tracks)
+        for track in binding_tracks:
+            for section in track.get_sections():
+                sections.append(section)
+                flags.append(section.is_active())
+    return {'sections': sections, 'flags': flags, 'tracks': tracks}
 
 
 def restore_active_state(data):
-    for tracks_data in data.values():
-        for sections in tracks_data.values():
-            for (section, active) in sections:
-                section.set_is_active(active)
+    for section, active in zip(data['sections'], data['flags']):
+        # Only cross into C++ for sections whose state actually changed
+        if section.is_active() != active:
+            section.set_is_active(active)
 
 
 def save_state_and_bake(bindings):
@@ -340,9 +761,9 @@ def save_state_and_bake(bindings):
 
     data = save_active_state(bindings)
     unreal.log(f"Save state of tracks before baking for bindings: {data}")
-    if not data:
-        return []
-    binding = next(iter(data))
+    if not data['tracks']:
+        return data
+    binding = next(iter(data['tracks']))
     # bake_transforms
     start_frame = binding.sequence.get_playback_start()
     end_frame = binding.sequence.get_playback_end()
@@ -360,7 +781,7 @@ def save_state_and_bake(bindings):
     #     unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(binding.sequence)
 
     unreal.log(f"Start baking of transforms for bindings: {bindings}")
-    bake_ok = unreal.get_editor_subsystem(unreal.LevelSequenceEditorSubsystem).bake_transform_with_settings(bindings, bake_settings)  # , params=unreal.MovieSceneTimeUnit.TICK_RESOLUTION)
+    bake_ok = _subsys(unreal.LevelSequenceEditorSubsystem).bake_transform_with_settings(bindings, bake_settings)  # , params=unreal.MovieSceneTimeUnit.TICK_RESOLUTION)
 
     return data
 
@@ -369,110 +790,105 @@ def restore_state_after_bake(data):
     # restore active state
     restore_active_state(data)
     # remove bake transform
-    for (binding, tracks_data) in data.items():
-        baked_transform_tracks = set(binding.get_tracks()).difference(tracks_data.keys())
+    for (binding, saved_tracks) in data['tracks'].items():
+        baked_transform_tracks = set(binding.get_tracks()).difference(saved_tracks)
         if not baked_transform_tracks:
             unreal.log_warning(f"Can't find baked transform for binding: '{binding.get_name()}'. Skip deletion.")
         for t in baked_transform_tracks:
             binding.remove_track(t)
 
 
-# def get_version(name):
-#     name, ok, ver = name.rpartition(' v')
-#     if not ok:
-#         return 0
-#     try:
-#         return int(ver)
-#     except:
-#         return None
+# Matches names with a " v<digits>" version tail, e.g. "SM_Gun v12".
+_VER_RE = re.compile(r'^(.*) v(\d+)\s*$')
+
+
+def _split_version(name):
+    # Single scan shared by get_version/set_version/up_version, so the
+    # common "read then bump" pattern doesn't rescan the same string.
+    m = _VER_RE.match(name)
+    if not m:
+        return name, None
+    return m.group(1), int(m.group(2))
+
+
+def get_version(name):
+    ver = _split_version(name)[1]
+    return 0 if ver is None else ver
 
 
-# def set_version(name, ver):
-#     _name, ok, _ = name.rpartition(' v')
-#     if ok:
-#         return f"{_name} v{int(ver)}"
-#     return f"{name} v{int(ver)}"
+def set_version(name, ver):
+    base = _split_version(name)[0]
+    return f"{base} v{int(ver)}"
 
 
-# def up_version(name):
-#     _name, ok, ver = name.rpartition(' v')
-#     if not ok:
-#         ver = 0
-#     else:
-#         ver = int(ver)
-#         name = _name
+def up_version(name):
+    base, ver = _split_version(name)
+    return f"{base} v{(ver or 0) + 1}"
 
-#     ver += 1
-#     return f"{name} v{ver}"
+
+# Precompiled path shapes: one C-level match instead of a split list
+# plus slice comparisons per call.
+_ASSET_PATH_RE = re.compile(r'^/Game/[Aa]ssets/([^/]+)/([^/]+)(?:/([^/]+))?')
+_SHOT_PATH_RE = re.compile(r'^/Game/[Ss]cenes/([^/]+)/([^/]+)/([^/]+)')
+# Level object paths: scene/shot/step sit after the first two components
+_LEVEL_PATH_RE = re.compile(r'^/[^/]+/[^/]+/([^/]+)/([^/]+)/([^/]+)')
 
 
 def ctx_from_asset_path(path):
     # /Game/Assets/Prop/SM_Gun/SM_Gun
-    splitted = path.split('/')
-    if splitted[:3] in (['', 'Game', 'Assets'], ['', 'Game', 'assets']):
-        if len(splitted) >= 6:
-            asset_type, code, step = splitted[3:6]
-        elif len(splitted) == 5:
-            asset_type, code = splitted[3:5]
-            step = 'MDL'
-
-        return asset_type, code, step
+    m = _ASSET_PATH_RE.match(path)
+    if not m:
+        return None
 
-    return None
+    asset_type, code, step = m.groups()
+    return asset_type, code, step or 'MDL'
 
 
 def ctx_from_shot_path(path):
-    splitted = path.split('/')
-    if splitted[:3] in (['', 'Game', 'Scenes'], ['', 'Game', 'scenes']):
-        if len(splitted) >= 6:
-            scn, shot, step = splitted[3:6]
-            return scn, shot, step
+    m = _SHOT_PATH_RE.match(path)
+    if not m:
+        return None
 
-    return None
+    scn, shot, step = m.groups()
+    return scn, shot, step
 
 
 def ctx_from_movie_path(path):
-    base, ext = os.path.splitext(path)
-    # if ext.lower() not in ('.mov'):
-    #     return
+    # Everything before the first dot of the basename; version/frame
+    # suffixes and the extension fall away together.
+    name = os.path.basename(path).partition(".")[0]
 
-    name = os.path.basename(path).split(".")[0]
     splitted = name.split("_", 2)
     if len(splitted) < 2:
         return
 
     scene = splitted[0]
-    shot = "_".join(splitted[:2])
-    try:
-        task = splitted[2]
-        return scene, shot, "LGT", task
-    except:
-        return scene, shot, "LGT", "Lighting"
+    shot = f"{scene}_{splitted[1]}"
+    task = splitted[2] if len(splitted) == 3 else "Lighting"
+    return scene, shot, "LGT", task
 
 
 def ctx_from_sequence(seq):
-    seq_name = seq.get_name()
-    seq_name = seq_name.rstrip('_sub')
-    l = seq_name.split('_')
-    if len(l) != 3:
+    seq_name = seq.get_name().removesuffix('_sub')
+    # Exactly <scene>_<code>_<step>, rejected with cheap predicates
+    # instead of tokenizing the whole name.
+    scene, _, rest = seq_name.partition('_')
+    code, _, step = rest.partition('_')
+    if not step or '_' in step:
         return None
-    scene, code, step = l
-    code = '_'.join((scene, code))
-    return scene, code, step
+    return scene, f"{scene}_{code}", step
 
 
 def ctx_from_level(level):
-    path = level.get_path_name()
-    try:
-        scene, code, step = path.split('/')[3:6]
-        return scene, code, step
-    except:
+    m = _LEVEL_PATH_RE.match(level.get_path_name())
+    if not m:
         return None
+    return m.groups()
 
 
+@functools.lru_cache(maxsize=256)
 def step_short_name2(step_id):
-    import sgtk
-    engine = sgtk.platform.current_engine()
+    engine = _engine()
 
     data = engine.shotgun.find_one("Step", [
         ["id", "is", step_id],
@@ -483,21 +899,33 @@ def step_short_name2(step_id):
         return data["short_name"]
 
 
+@functools.lru_cache(maxsize=256)
 def step_short_name(task_id):
-    import sgtk
-    engine = sgtk.platform.current_engine()
-    step = engine.shotgun.find_one("Task", [
+    engine = _engine()
+    # Deep-linked field resolves the step name in a single round-trip
+    # instead of chaining a Task and a Step query.
+    data = engine.shotgun.find_one("Task", [
         ["id", "is", task_id],
+    ], ["step.Step.short_name"])
+    if data:
+        return data["step.Step.short_name"]
+
 
-    ], ["step"])['step']
+def step_short_names(task_ids):
+    """
+    Step short names for many tasks in one round-trip
 
-    step_short_name = engine.shotgun.find_one("Step", [["id", "is", step['id']]], ["short_name"])["short_name"]
-    return step_short_name
+    :returns: A {task_id: short_name} dict
+    """
+    rows = _engine().shotgun.find("Task", [
+        ["id", "in", list(task_ids)],
+    ], ["step.Step.short_name"])
+    return {row["id"]: row["step.Step.short_name"] for row in rows}
 
 
+@functools.lru_cache(maxsize=256)
 def sg_asset_type(asset_id):
-    import sgtk
-    engine = sgtk.platform.current_engine()
+    engine = _engine()
     data = engine.shotgun.find_one("Asset", [
         ["id", "is", asset_id],
     ],
@@ -507,12 +935,58 @@ def sg_asset_type(asset_id):
         return data["sg_asset_type"]
 
 
+def sg_asset_types(asset_ids):
+    """
+    Asset types for many assets in one round-trip
+
+    :returns: An {asset_id: sg_asset_type} dict
+    """
+    rows = _engine().shotgun.find("Asset", [
+        ["id", "in", list(asset_ids)],
+    ], ["sg_asset_type"])
+    return {row["id"]: row["sg_asset_type"] for row in rows}
+
+
+def _entity_step_info(entity, step):
+    """
+    Resolve the step short name (and the asset type for assets) in a
+    single round-trip via the Task that links the entity and the step.
+    Returns (None, None) when no such task exists.
+    """
+    engine = _engine()
+
+    fields = ["step.Step.short_name"]
+    if entity["type"] == "Asset":
+        fields.append("entity.Asset.sg_asset_type")
+
+    data = engine.shotgun.find_one("Task", [
+        ["entity", "is", {"type": entity["type"], "id": entity["id"]}],
+        ["step", "is", {"type": "Step", "id": step["id"]}],
+    ], fields)
+    if not data:
+        return None, None
+    return data.get("step.Step.short_name"), data.get("entity.Asset.sg_asset_type")
+
+
+def clear_sg_caches():
+    """Drop memoized Shotgun lookups, e.g. on engine restart"""
+    _invalidate_sg_cache()
+    _engine.cache_clear()
+    step_short_name.cache_clear()
+    step_short_name2.cache_clear()
+    sg_asset_type.cache_clear()
+    # Paths derived from the pipeline configuration move with it when
+    # the engine restarts into another project.
+    tk_root.cache_clear()
+    _ensure_scripts_path.cache_clear()
+    ffmpeg_path.cache_clear()
+    _ffprobe_path.cache_clear()
+
+
 def ctx_from_context(context):
     entity = context.entity
     step = context.step
 
-    step_shortname = None
-
     if (not entity) or (not step):
         return
 
@@ -524,34 +998,38 @@ def ctx_from_context(context):
         if not shot:
             return
         scene = shot.split("_", 1)[0]
-        step_shortname = step_short_name2(step_id)
+        step_shortname, _ = _entity_step_info(entity, step)
         if not step_shortname:
-            step_shortname = "LAY"
+            # No task links this entity and step, resolve the step alone
+            step_shortname = step_short_name2(step_id) or "LAY"
         return scene, shot, step_shortname
 
     elif entity_type == "Asset":
         asset = entity.get("code", entity.get("name"))
         if not asset:
             return
-        asset_type = sg_asset_type(entity["id"])
-        if not asset_type:
-            asset_type = "Prop"
-        step_shortname = step_short_name2(step_id)
+        step_shortname, asset_type = _entity_step_info(entity, step)
         if not step_shortname:
-            step_shortname = "MDL"
+            step_shortname = step_short_name2(step_id) or "MDL"
+        if not asset_type:
+            asset_type = sg_asset_type(entity["id"]) or "Prop"
         return asset_type, asset, step_shortname
 
 
-def last_published_info(ctx, published_name):
-    import sgtk
-    engine = sgtk.platform.current_engine()
+def _published_file_filters(ctx):
+    # One ctx.to_dict() serialization shared by the last_published_*
+    # family instead of one per lookup.
     d = ctx.to_dict()
-    project = d['project']
-    entity = d['entity']
+    return [
+        ["project", "is", d['project']],
+        ["entity", "is", d['entity']],
+    ]
+
 
-    data = engine.shotgun.find_one("PublishedFile", [
-        ["project", "is", project],
-        ["entity", "is", entity],
+def last_published_info(ctx, published_name):
+    engine = _engine()
+
+    data = engine.shotgun.find_one("PublishedFile", _published_file_filters(ctx) + [
         ["name", "is", published_name],
     ],
         fields=["version_number", "updated_at"],
@@ -562,53 +1040,68 @@ def last_published_info(ctx, published_name):
     return data
 
 
-def last_published_version(ctx, published_name):
-    import sgtk
-    engine = sgtk.platform.current_engine()
-    d = ctx.to_dict()
-    project = d['project']
-    entity = d['entity']
+def last_published_versions(ctx, published_names):
+    """
+    Last published version per name in a single Shotgun query
 
-    data = engine.shotgun.find_one("PublishedFile", [
-        ["project", "is", project],
-        ["entity", "is", entity],
-        ["name", "is", published_name],
+    :param published_names: A list of PublishedFile names
+    :returns: A {name: version_number} dict; missing names have no entry
+    """
+    engine = _engine()
+
+    rows = engine.shotgun.find("PublishedFile", _published_file_filters(ctx) + [
+        ["name", "in", list(published_names)],
     ],
-        fields=["version_number"],
-        order=[
-            {'field_name': 'version_number', 'direction': 'desc'},
-    ]
+        fields=["name", "version_number"],
     )
-    if data:
-        return data.get("version_number")
 
+    versions = {}
+    for row in rows:
+        name = row["name"]
+        version = row.get("version_number") or 0
+        if version > versions.get(name, -1):
+            versions[name] = version
+    return versions
 
-def create_asset_context(asset_type, asset, step=None, task_name=None):
-    import sgtk
-    engine = sgtk.platform.current_engine()
 
-    ctx = engine.context
-    asset = engine.shotgun.find_one("Asset", [
-        ["project", "is", ctx.project],
-        ["sg_asset_type", "is", asset_type],
-        ["code", "is", asset],
-    ])
-    if not asset:
-        return
+def last_published_version(ctx, published_name):
+    return last_published_versions(ctx, [published_name]).get(published_name)
 
-    task_data = None
+
+def _find_task(engine, entity_filters, step, task_name):
+    # One or-filtered query instead of a content lookup followed by a
+    # step fallback lookup (sg.batch() only supports writes). The content
+    # match still wins over the step match. The entity is addressed
+    # through deep-linked filters so no separate entity query is needed.
+    task_filters = [["step.Step.short_name", "is", step]]
     if task_name:
-        task_data = engine.shotgun.find_one("Task", [
-            ["entity", "is", asset],
-            ["content", "is", task_name],
-        ], ["name", "content", "step.Step.short_name"])
+        task_filters.append(["content", "is", task_name])
+
+    tasks = engine.shotgun.find("Task", entity_filters + [
+        {"filter_operator": "any", "filters": task_filters},
+    ], ["name", "content", "step.Step.short_name"])
+
+    if task_name:
+        for task_data in tasks:
+            if task_data["content"] == task_name:
+                return task_data
+
+    for task_data in tasks:
+        if task_data["step.Step.short_name"] == step:
+            return task_data
+
+    return None
 
-    if not task_data:
-        task_data = engine.shotgun.find_one("Task", [
-            ["step.Step.short_name", "is", step],
-            ["entity", "is", asset],
-        ], ["name", "content", "step.Step.short_name"])
 
+def create_asset_context(asset_type, asset, step=None, task_name=None):
+    engine = _engine()
+
+    ctx = engine.context
+    task_data = _find_task(engine, [
+        ["project", "is", ctx.project],
+        ["entity.Asset.sg_asset_type", "is", asset_type],
+        ["entity.Asset.code", "is", asset],
+    ], step, task_name)
     if not task_data:
         return
 
@@ -617,34 +1110,17 @@ def create_asset_context(asset_type, asset, step=None, task_name=None):
 
 
 def create_shot_context(scene, shot, step=None, task_name=None):
-    import sgtk
-    engine = sgtk.platform.current_engine()
+    engine = _engine()
 
     if (not task_name) and (step == "LAY"):
         task_name = "AnimLayout"
 
     ctx = engine.context
-    shot = engine.shotgun.find_one("Shot", [
+    task_data = _find_task(engine, [
         ["project", "is", ctx.project],
-        ["sg_sequence.Sequence.code", "is", scene],
-        ["code", "is", shot],
-    ])
-    if not shot:
-        return
-
-    task_data = None
-    if task_name:
-        task_data = engine.shotgun.find_one("Task", [
-            ["entity", "is", shot],
-            ["content", "is", task_name],
-        ], ["name", "content", "step.Step.short_name"])
-
-    if not task_data:
-        task_data = engine.shotgun.find_one("Task", [
-            ["step.Step.short_name", "is", step],
-            ["entity", "is", shot],
-        ], ["name", "content", "step.Step.short_name"])
-
+        ["entity.Shot.sg_sequence.Sequence.code", "is", scene],
+        ["entity.Shot.code", "is", shot],
+    ], step, task_name)
     if not task_data:
         return
 
@@ -652,6 +1128,122 @@ def create_shot_context(scene, shot, step=None, task_name=None):
     return ctx
 
 
+def batch_import(items):
+    """
+    Import a mixed batch of assets in one import_asset_tasks call
+
+    :param items: A list of (kind, spec) tuples where kind is one of
+                  "alembic", "fbx" or "vdb" and spec is a dict with the
+                  keyword arguments accepted by the matching
+                  _generate_*_import_task function
+    :returns: A list with the first imported object path per item, or None
+              for items that imported nothing
+    """
+    # Resolved at call time, the generators are defined further down.
+    generators = {
+        "alembic": _generate_alembic_import_task,
+        "fbx": _generate_fbx_import_task,
+        "vdb": _generate_vdb_import_task,
+    }
+    tasks = [generators[kind](**spec) for kind, spec in items]
+    # One import_asset_tasks call for the whole batch, the editor only
+    # pays the per-call overhead once.
+    _asset_tools().import_asset_tasks(tasks)
+
+    paths = []
+    for task in tasks:
+        if task.imported_object_paths:
+            unreal.log(f"Import Task for: {task.filename}")
+            paths.append(task.imported_object_paths[0])
+        else:
+            unreal.log_warning(f"No objects were imported for '{task.filename}'")
+            paths.append(None)
+    return paths
+
+
+def unreal_import_alembic_assets(specs, create_actor=False):
+    """
+    Import several ABC files into Unreal Content Browser in one batch
+
+    :param specs: A list of dicts with the keyword arguments accepted by
+                  _generate_alembic_import_task
+    :param create_actor: Spawn a Geometry Cache actor per imported cache
+                         and bind it to the shot sub-sequence
+    :returns: A list with the first imported object path per task, or None
+              for tasks that imported nothing
+    """
+    paths = batch_import([("alembic", spec) for spec in specs])
+
+    if create_actor:
+        # Group by destination so each shot's level and sequence only
+        # load once however many caches went into it.
+        by_dest = {}
+        for spec, path in zip(specs, paths):
+            if path:
+                by_dest.setdefault(spec["destination_path"], []).append((spec["destination_name"], path))
+
+        for destination_path, items in by_dest.items():
+            ctx = ctx_from_shot_path(destination_path)
+            if not ctx:
+                unreal.log_warning(f"'{destination_path}' is not a shot path. Skip actor creation.")
+                continue
+            scn, shot, step = ctx
+            level_path = f"{destination_path}/{shot}_{step}"
+            seq_name = f"{shot}_{step}_sub"
+
+            seq = _load_seq(f"{level_path}_sub")
+
+            todo = []
+            for destination_name, path in items:
+                if seq and find_possessable(seq, destination_name):
+                    unreal.log(f"Geometry Cache track '{destination_name}' exists. Skip creation.")
+                else:
+                    todo.append((destination_name, path))
+            if not todo:
+                continue
+
+            _load_level(level_path)
+            # unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(seq)
+
+            for destination_name, path in todo:
+                _create_geometry_cache_actor(seq, path, destination_name)
+                unreal.log(f"Geometry Cache actor '{destination_name}' added to the level and sequence '{seq_name}'.")
+
+    return paths
+
+
+def _create_geometry_cache_actor(seq, geometry_cache_path, destination_name):
+    """
+    Spawn a Geometry Cache actor in the current level and bind it to seq
+    """
+    actor = find_actor(destination_name, unreal.GeometryCacheActor)
+    if actor:
+        unreal.log(f"Geometry Cache actor '{destination_name}' exists. Replace it.")
+        actor.destroy_actor()
+        _invalidate_actor_cache()
+        # return geometry_cache_path
+
+    geometry_cache = unreal.load_asset(geometry_cache_path)
+
+    # Spawn the Geometry Cache actor
+    geometry_cache_actor = _editor_actor_subsystem().spawn_actor_from_object(geometry_cache, _V_ZERO, _R_ZERO)
+    geometry_cache_actor.set_actor_label(destination_name)
+    _invalidate_actor_cache()
+
+    # Add the Geometry Cache actor to the Level Sequence
+    possessable = seq.add_possessable(geometry_cache_actor)
+    _invalidate_seq_cache(seq)
+    # possessable = seq.add_spawnable_from_instance(geometry_cache_actor)
+    track = possessable.add_track(unreal.MovieSceneGeometryCacheTrack)
+    section = track.add_section()
+    sequence_end = seq.get_playback_end()
+    section.set_range(SHOT_SEQUENCE_START, sequence_end)
+    section.set_completion_mode(_KEEP_STATE)
+    section.params = unreal.MovieSceneGeometryCacheParams(
+        geometry_cache_asset=geometry_cache,
+    )
+
+
 def unreal_import_alembic_asset(input_path, destination_path, destination_name, automated=True, create_actor=False):
     """
     Import an ABC into Unreal Content Browser
@@ -661,63 +1253,18 @@ def unreal_import_alembic_asset(input_path, destination_path, destination_name,
     :param destination_name: The asset name to use; if None, will use the filename without extension
     """
     unreal.log(f"Destination path: {destination_path}")
-    tasks = []
-    tasks.append(_generate_alembic_import_task(input_path, destination_path, destination_name, automated=automated))
-
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
-
-    task = tasks[0]
-
-    if not task.imported_object_paths:
-        unreal.log_warning("No objects were imported")
+    geometry_cache_path = unreal_import_alembic_assets([{
+        "filename": input_path,
+        "destination_path": destination_path,
+        "destination_name": destination_name,
+        "automated": automated,
+    }], create_actor=create_actor)[0]
+
+    if not geometry_cache_path:
         return None
 
-    unreal.log(f"Import Task for: {task.filename}")
-    geometry_cache_path = task.imported_object_paths[0]
     unreal.log(f"Imported object: {geometry_cache_path}")
 
-    if create_actor:
-        ctx = ctx_from_shot_path(destination_path)
-        scn, shot, step = ctx
-        level_name = f"{shot}_{step}"
-        seq_name = f"{shot}_{step}_sub"
-
-        seq = unreal.load_asset(f"{destination_path}/{seq_name}")
-
-        if seq and find_possessable(seq, destination_name):
-            unreal.log(f"Geometry Cache track '{destination_name}' exists. Skip creation.")
-            return geometry_cache_path
-
-        unreal.get_editor_subsystem(unreal.LevelEditorSubsystem).load_level(f"{destination_path}/{level_name}")
-        # unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(seq)
-
-        actor = find_actor(destination_name, unreal.GeometryCacheActor)
-        if actor:
-            unreal.log(f"Geometry Cache actor '{destination_name}' exists. Replace it.")
-            actor.destroy_actor()
-            # return geometry_cache_path
-
-        geometry_cache = unreal.load_asset(geometry_cache_path)
-
-        # Spawn the Geometry Cache actor
-        geometry_cache_actor = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).spawn_actor_from_object(geometry_cache, unreal.Vector(0, 0, 0), unreal.Rotator(0, 0, 0))
-        geometry_cache_actor.set_actor_label(destination_name)
-
-        # Add the Geometry Cache actor to the Level Sequence
-        possessable = seq.add_possessable(geometry_cache_actor)
-        # possessable = seq.add_spawnable_from_instance(geometry_cache_actor)
-        track = possessable.add_track(unreal.MovieSceneGeometryCacheTrack)
-        section = track.add_section()
-        sequence_end = seq.get_playback_end()
-        section.set_range(SHOT_SEQUENCE_START, sequence_end)
-        section.set_completion_mode(unreal.MovieSceneCompletionMode.KEEP_STATE)
-        section.params = unreal.MovieSceneGeometryCacheParams(
-            geometry_cache_asset=geometry_cache,
-        )
-        # Log success
-        unreal.log(f"Geometry Cache actor '{destination_name}' added to the level and sequence '{seq_name}'.")
-        return geometry_cache_path
-
     # Focus the Unreal Content Browser on the imported asset
     # unreal.EditorAssetLibrary.sync_browser_to_objects([geometry_cache_path])
     return geometry_cache_path
@@ -734,19 +1281,16 @@ def unreal_import_vdb(input_path, destination_path, destination_name, automated=
 
     unreal.log(f"Destination name: {destination_name}")
     unreal.log(f"Destination path: {destination_path}")
-    tasks = []
-    tasks.append(_generate_vdb_import_task(input_path, destination_path, destination_name, automated=automated))
-
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
-
-    task = tasks[0]
-
-    if not task.imported_object_paths:
-        unreal.log_warning("No objects were imported")
+    vdb_path = batch_import([("vdb", {
+        "filename": input_path,
+        "destination_path": destination_path,
+        "destination_name": destination_name,
+        "automated": automated,
+    })])[0]
+
+    if not vdb_path:
         return None
 
-    unreal.log(f"Import Task for: {task.filename}")
-    vdb_path = task.imported_object_paths[0]
     unreal.log(f"Imported object: {vdb_path}")
 
     if create_actor:
@@ -777,32 +1321,35 @@ def unreal_import_vdb(input_path, destination_path, destination_name, automated=
 
         ctx = ctx_from_shot_path(destination_path)
         scn, shot, step = ctx
-        level_name = f"{shot}_{step}"
+        level_path = f"{destination_path}/{shot}_{step}"
         seq_name = f"{shot}_{step}_sub"
 
-        seq = unreal.load_asset(f"{destination_path}/{seq_name}")
+        seq = _load_seq(f"{level_path}_sub")
 
         if seq and find_possessable(seq, actor_name):
             unreal.log(f"VDB track '{actor_name}' exists. Skip creation.")
             return vdb_path
 
-        unreal.get_editor_subsystem(unreal.LevelEditorSubsystem).load_level(f"{destination_path}/{level_name}")
+        _load_level(level_path)
         # unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(seq)
 
         actor = find_actor(actor_name, unreal.HeterogeneousVolume.static_class())
         if actor:
             unreal.log(f"VDB actor '{actor_name}' exists. Replace it.")
             actor.destroy_actor()
+            _invalidate_actor_cache()
             # return geometry_cache_path
 
-        actor = unreal.get_editor_subsystem(unreal.EditorActorSubsystem).spawn_actor_from_class(unreal.HeterogeneousVolume.static_class(), unreal.Vector(0, 0, 0), unreal.Rotator(0, 0, 0))
+        actor = _editor_actor_subsystem().spawn_actor_from_class(unreal.HeterogeneousVolume.static_class(), _V_ZERO, _R_ZERO)
         actor.set_actor_label(actor_name)
-        actor.set_actor_scale3d(unreal.Vector(100.0, 100.0, 100.0))
-        actor.set_actor_rotation(unreal.Rotator(-90.0, 0.0, 0.0), False)
+        _invalidate_actor_cache()
+        actor.set_actor_scale3d(_V_VDB_SCALE)
+        actor.set_actor_rotation(_R_VDB_ROT, False)
         heterogeneous_volume_component = actor.get_component_by_class(unreal.HeterogeneousVolumeComponent.static_class())
 
         # add a binding for the actor
         binding = seq.add_possessable(actor)
+        _invalidate_seq_cache(seq)
         binding.set_name(actor_name)
         binding.set_display_name(actor_name)
         unreal.log(f"Add as posessable to sequence '{seq}'")
@@ -818,11 +1365,11 @@ def unreal_import_vdb(input_path, destination_path, destination_name, automated=
         section = track.add_section()
         section.set_start_frame_bounded(0)
         section.set_end_frame_bounded(0)
-        section.set_completion_mode(unreal.MovieSceneCompletionMode.KEEP_STATE)
+        section.set_completion_mode(_KEEP_STATE)
         channel = section.get_all_channels()[0]
 
-        channel.add_key(unreal.FrameNumber(start_frame), float(start_frame), interpolation=unreal.MovieSceneKeyInterpolation.LINEAR)
-        channel.add_key(unreal.FrameNumber(end_frame), float(end_frame), interpolation=unreal.MovieSceneKeyInterpolation.LINEAR)
+        channel.add_key(unreal.FrameNumber(start_frame), float(start_frame), interpolation=_KEY_LINEAR)
+        channel.add_key(unreal.FrameNumber(end_frame), float(end_frame), interpolation=_KEY_LINEAR)
 
         heterogeneous_volume_component.set_editor_property("override_materials", [mat])
 
@@ -834,22 +1381,22 @@ def unreal_import_vdb(input_path, destination_path, destination_name, automated=
     return vdb_path
 
 
-def _generate_vdb_import_task(
+def _make_import_task(
     filename,
     destination_path,
     destination_name=None,
     replace_existing=True,
-    automated=False,
+    automated=True,
     save=True,
+    async_=False,
 ):
     """
-    Create and configure an Unreal AssetImportTask
+    Build an AssetImportTask with the fields every importer shares
 
-    :param filename: The fbx file to import
-    :param destination_path: The Content Browser path where the asset will be placed
-    :return the configured AssetImportTask
+    Callers read imported_object_paths right after import_asset_tasks
+    returns; an async task may not have populated them yet, so async_
+    stays off unless a caller really defers the result.
     """
-
     task = unreal.AssetImportTask()
     task.filename = filename
     task.destination_path = destination_path
@@ -861,7 +1408,30 @@ def _generate_vdb_import_task(
     task.replace_existing = replace_existing
     task.automated = automated
     task.save = save
-    task.async_ = True
+    task.async_ = async_
+
+    return task
+
+
+def _generate_vdb_import_task(
+    filename,
+    destination_path,
+    destination_name=None,
+    replace_existing=True,
+    automated=False,
+    save=True,
+    async_=False,
+):
+    """
+    Create and configure an Unreal AssetImportTask
+
+    :param filename: The fbx file to import
+    :param destination_path: The Content Browser path where the asset will be placed
+    :return the configured AssetImportTask
+    """
+
+    task = _make_import_task(filename, destination_path, destination_name,
+                             replace_existing, automated, save, async_)
 
     return task
 
@@ -876,12 +1446,11 @@ def unreal_import_fbx_camera(input_path, destination_path, destination_name):
     """
 
     scn, shot, step = ctx_from_shot_path(destination_path)
-    level_name = f"{shot}_{step}"
-    seq_name = f"{shot}_{step}_sub"
+    level_path = f"{destination_path}/{shot}_{step}"
     cam_name = f"{shot}_Camera"
 
-    unreal.get_editor_subsystem(unreal.LevelEditorSubsystem).load_level(f"{destination_path}/{level_name}")
-    seq = unreal.load_asset(f"{destination_path}/{seq_name}")
+    _load_level(level_path)
+    seq = _load_seq(f"{level_path}_sub")
 
     binding = find_actor_sequence_binding(seq, cam_name)
     seq = binding.sequence
@@ -894,13 +1463,25 @@ def unreal_import_fbx_camera(input_path, destination_path, destination_name):
     import_setting.set_editor_property('reduce_keys_tolerance', 0.001)
 
     # world = unreal.EditorLevelLibrary.get_editor_world()
-    world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+    world = _editor_world()
     ok = unreal.SequencerTools.import_level_sequence_fbx(world, seq, [binding], import_setting, input_path)
 
     # unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(seq)
     return ok
 
 
+def unreal_import_fbx_assets(specs):
+    """
+    Import several FBX files into Unreal Content Browser in one batch
+
+    :param specs: A list of dicts with the keyword arguments accepted by
+                  _generate_fbx_import_task
+    :returns: A list with the first imported object path per task, or None
+              for tasks that imported nothing
+    """
+    return batch_import([("fbx", spec) for spec in specs])
+
+
 def unreal_import_fbx_asset(input_path, destination_path, destination_name, automated=True):
     """
     Import an FBX into Unreal Content Browser
@@ -909,22 +1490,16 @@ def unreal_import_fbx_asset(input_path, destination_path, destination_name, auto
     :param destination_path: The Content Browser path where the asset will be placed
     :param destination_name: The asset name to use; if None, will use the filename without extension
     """
-
-    tasks = []
-    tasks.append(_generate_fbx_import_task(input_path, destination_path, destination_name, automated=automated))
-
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
-
-    first_imported_object = None
-
-    task = tasks[0]
-
-    if not task.imported_object_paths:
-        unreal.log_warning("No objects were imported")
+    object_path = unreal_import_fbx_assets([{
+        "filename": input_path,
+        "destination_path": destination_path,
+        "destination_name": destination_name,
+        "automated": automated,
+    }])[0]
+
+    if not object_path:
         return None
 
-    unreal.log("Import Task for: {}".format(task.filename))
-    object_path = task.imported_object_paths[0]
     unreal.log("Imported object: {}".format(object_path))
 
     # Focus the Unreal Content Browser on the imported asset
@@ -932,6 +1507,28 @@ def unreal_import_fbx_asset(input_path, destination_path, destination_name, auto
     return object_path
 
 
+# FbxImportUI prototypes per option combination, built lazily. Import
+# tasks copy their options, so sharing a prototype between tasks is safe.
+_fbx_ui_cache = {}
+
+
+def _fbx_import_ui(materials, textures, as_skeletal):
+    key = (materials, textures, as_skeletal)
+    options = _fbx_ui_cache.get(key)
+    if options is None:
+        options = unreal.FbxImportUI()
+        options.import_materials = materials
+        options.import_textures = textures
+        options.import_as_skeletal = as_skeletal
+        # options.static_mesh_import_data.combine_meshes = True
+        if as_skeletal:
+            options.mesh_type_to_import = unreal.FBXImportType.FBXIT_SKELETAL_MESH
+        else:
+            options.mesh_type_to_import = unreal.FBXImportType.FBXIT_STATIC_MESH
+        _fbx_ui_cache[key] = options
+    return options
+
+
 def _generate_fbx_import_task(
     filename,
     destination_path,
@@ -941,7 +1538,8 @@ def _generate_fbx_import_task(
     save=True,
     materials=False,
     textures=False,
-    as_skeletal=False
+    as_skeletal=False,
+    async_=False,
 ):
     """
     Create and configure an Unreal AssetImportTask
@@ -950,29 +1548,27 @@ def _generate_fbx_import_task(
     :param destination_path: The Content Browser path where the asset will be placed
     :return the configured AssetImportTask
     """
-    task = unreal.AssetImportTask()
-    task.filename = filename
-    task.destination_path = destination_path
-
-    # By default, destination_name is the filename without the extension
-    if destination_name is not None:
-        task.destination_name = destination_name
-
-    task.replace_existing = replace_existing
-    task.automated = automated
-    task.save = save
+    task = _make_import_task(filename, destination_path, destination_name,
+                             replace_existing, automated, save, async_)
+    task.options = _fbx_import_ui(materials, textures, as_skeletal)
 
-    task.options = unreal.FbxImportUI()
-    task.options.import_materials = materials
-    task.options.import_textures = textures
-    task.options.import_as_skeletal = as_skeletal
-    # task.options.static_mesh_import_data.combine_meshes = True
+    return task
 
-    task.options.mesh_type_to_import = unreal.FBXImportType.FBXIT_STATIC_MESH
-    if as_skeletal:
-        task.options.mesh_type_to_import = unreal.FBXImportType.FBXIT_SKELETAL_MESH
 
-    return task
+# Shared alembic sub-settings, built once. Tasks never mutate them, so
+# every AbcImportSettings can point at the same objects instead of
+# allocating new UObjects per import.
+_ABC_CONVERSION = unreal.AbcConversionSettings(
+    scale=unreal.Vector(1, -1, 1),
+    rotation=unreal.Vector(90, 0.0, 0.0)
+)
+_ABC_GEOMETRY_CACHE = unreal.AbcGeometryCacheSettings(
+    compressed_position_precision=0.001,
+)
+_ABC_SAMPLING = unreal.AbcSamplingSettings(
+    frame_start=1001,
+)
+_ABC_MATERIAL = unreal.AbcMaterialSettings(find_materials=True)
 
 
 def _generate_alembic_import_task(
@@ -982,56 +1578,84 @@ def _generate_alembic_import_task(
     replace_existing=True,
     automated=True,
     save=True,
+    async_=False,
+    compressed_position_precision=None,
+    frame_start=None,
+    frame_end=None,
+    import_type=None,
 ):
     """
     Create and configure an Unreal AssetImportTask
 
     :param filename: The fbx file to import
     :param destination_path: The Content Browser path where the asset will be placed
+    :param compressed_position_precision: Override the geometry cache
+        position precision; looser values shrink the cache on disk and
+        its memory traffic at playback
+    :param frame_start: Override the sampling start frame
+    :param frame_end: Override the sampling end frame
+    :param import_type: An unreal.AlembicImportType; SKELETAL suits
+        constant-topology skinned caches
     :return the configured AssetImportTask
     """
 
-    task = unreal.AssetImportTask()
-    task.filename = filename
-    task.destination_path = destination_path
-
-    # By default, destination_name is the filename without the extension
-    if destination_name is not None:
-        task.destination_name = destination_name
-
-    task.replace_existing = replace_existing
-    task.automated = automated
-    task.save = save
-    task.async_ = True
+    task = _make_import_task(filename, destination_path, destination_name,
+                             replace_existing, automated, save, async_)
 
     alembic_settings = unreal.AbcImportSettings()
+    alembic_settings.conversion_settings = _ABC_CONVERSION
 
-    alembic_settings.conversion_settings = unreal.AbcConversionSettings(
-        scale=unreal.Vector(1, -1, 1),  # Set the scale using a Vector (adjust the values accordingly)
-        rotation=unreal.Vector(90, 0.0, 0.0)  # Set the rotation using a Vector (adjust the values accordingly)
-    )
-    alembic_settings.geometry_cache_settings = unreal.AbcGeometryCacheSettings(
-        compressed_position_precision=0.001,
-    )
-    alembic_settings.sampling_settings = unreal.AbcSamplingSettings(
-        frame_start=1001,
+    # The shared templates cover the default settings; only overrides
+    # allocate fresh UObjects.
+    if compressed_position_precision is None:
+        alembic_settings.geometry_cache_settings = _ABC_GEOMETRY_CACHE
+    else:
+        alembic_settings.geometry_cache_settings = unreal.AbcGeometryCacheSettings(
+            compressed_position_precision=compressed_position_precision,
+        )
 
-    )
-    alembic_settings.material_settings = unreal.AbcMaterialSettings(find_materials=True)
+    if frame_start is None and frame_end is None:
+        alembic_settings.sampling_settings = _ABC_SAMPLING
+    else:
+        sampling_settings = unreal.AbcSamplingSettings(
+            frame_start=SHOT_SEQUENCE_START if frame_start is None else frame_start,
+        )
+        if frame_end is not None:
+            sampling_settings.frame_end = frame_end
+        alembic_settings.sampling_settings = sampling_settings
 
-    alembic_settings.import_type = unreal.AlembicImportType.GEOMETRY_CACHE
+    alembic_settings.material_settings = _ABC_MATERIAL
+    alembic_settings.import_type = _ABC_GEOM_CACHE if import_type is None else import_type
     task.options = alembic_settings
 
     return task
 
 
-def export_asset_to_fbx(filename, asset):
-    """
-    Export an asset to FBX from Unreal
+# FbxExportOption prototypes per option combination, built lazily and
+# reused across exports. Exporters only read the options object.
+_fbx_export_cache = {}
 
-    :param destination_path: The path where the exported FBX will be placed
-    :param actor: The Unreal actor to export to FBX
-    """
+
+def _fbx_export_option(map_skeletal_motion_to_root=False):
+    options = _fbx_export_cache.get(map_skeletal_motion_to_root)
+    if options is None:
+        options = unreal.FbxExportOption()
+        options.bake_camera_and_light_animation = unreal.MovieSceneBakeType.BAKE_ALL
+        options.bake_actor_animation = unreal.MovieSceneBakeType.BAKE_ALL
+        options.collision = False
+        options.level_of_detail = False
+        options.map_skeletal_motion_to_root = map_skeletal_motion_to_root
+        # These are the default options for the FBX export
+        # options.fbx_export_compatibility = fbx_2013
+        # options.ascii = False
+        # options.force_front_x_axis = False
+        # options.vertex_color = True
+        # options.welded_vertices = True
+        _fbx_export_cache[map_skeletal_motion_to_root] = options
+    return options
+
+
+def _make_export_task(filename, asset):
     # Setup AssetExportTask for non-interactive mode
     task = unreal.AssetExportTask()
     task.object = asset     # the asset to export
@@ -1040,32 +1664,71 @@ def export_asset_to_fbx(filename, asset):
     task.replace_identical = True   # always overwrite the output
 
     # Setup export options for the export task
-    task.options = unreal.FbxExportOption()
-    task.options.bake_camera_and_light_animation = unreal.MovieSceneBakeType.BAKE_ALL
-    task.options.bake_actor_animation = unreal.MovieSceneBakeType.BAKE_ALL
-    task.options.collision = False
-    task.options.level_of_detail = False
-    task.options.map_skeletal_motion_to_root = True
-    # task.options.fbx_export_compatibility = fbx_2013
-    # task.options.ascii = False
-    # task.options.force_front_x_axis = False
-    # task.options.vertex_color = True
-    # task.options.level_of_detail = True
-    # task.options.welded_vertices = True
-
-    # Do the FBX export
-    result = unreal.Exporter.run_asset_export_task(task)
+    task.options = _fbx_export_option(map_skeletal_motion_to_root=True)
+    return task
 
-    if not result:
-        unreal.log_error(f"Failed to export asset '{asset}' to '{filename}'")
-        for error_msg in task.errors:
-            unreal.log_error(f"{error_msg}")
 
-        return False
+def export_assets_to_fbx(pairs):
+    """
+    Export several assets to FBX in one exporter call
+
+    :param pairs: A list of (filename, asset) tuples
+    :returns: True when every export succeeded
+    """
+    tasks = [_make_export_task(filename, asset) for filename, asset in pairs]
+
+    # The array variant lets the engine amortize exporter startup over
+    # the batch; fall back to per-task runs where it isn't exposed.
+    run_tasks = getattr(unreal.Exporter, 'run_asset_export_tasks', None)
+    if run_tasks is not None:
+        result = bool(run_tasks(tasks))
+    else:
+        result = True
+        for task in tasks:
+            result = bool(unreal.Exporter.run_asset_export_task(task)) and result
+
+    if not result:
+        for task in tasks:
+            if task.errors:
+                unreal.log_error(f"Failed to export asset '{task.object}' to '{task.filename}'")
+                for error_msg in task.errors:
+                    unreal.log_error(f"{error_msg}")
 
     return result
 
 
+def export_asset_to_fbx(filename, asset):
+    """
+    Export an asset to FBX from Unreal
+
+    :param destination_path: The path where the exported FBX will be placed
+    :param actor: The Unreal actor to export to FBX
+    """
+    return export_assets_to_fbx([(filename, asset)])
+
+
+# Temp AnimSequence reused across skeletal exports; a create/delete
+# cycle per export churns the asset registry. delete_tmp_anim_sequence()
+# removes it, e.g. on engine shutdown.
+_TMP_ANIM_SEQ = "/Game/__sg_tmp/__tmp_anim_seq__"
+_tmp_anim_lock = threading.Lock()
+
+
+def _tmp_anim_sequence():
+    if unreal.EditorAssetLibrary.does_asset_exist(_TMP_ANIM_SEQ):
+        return unreal.EditorAssetLibrary.load_asset(_TMP_ANIM_SEQ)
+    path, name = _TMP_ANIM_SEQ.rsplit('/', 1)
+    anim_sequence = _asset_tools().create_asset(name, path, unreal.AnimSequence, None)
+    unreal.log(f"Create temp AnimSequence asset '{_TMP_ANIM_SEQ}'")
+    return anim_sequence
+
+
+def delete_tmp_anim_sequence():
+    if unreal.EditorAssetLibrary.does_asset_exist(_TMP_ANIM_SEQ):
+        _subsys(unreal.EditorAssetSubsystem).delete_asset(_TMP_ANIM_SEQ)
+        unreal.log(f"Delete temp AnimSequence asset '{_TMP_ANIM_SEQ}'")
+
+
 def export_bindings_to_fbx(filename, bindings, bake=True):
     """
     Export an bindings to FBX from Unreal
@@ -1088,7 +1751,14 @@ def export_bindings_to_fbx(filename, bindings, bake=True):
     actors = get_bound_actors(bindings)
     backup_enable_publish_mode = get_properties(actors, ['Enable Publish Mode'])
 
-    set_properties(actors, {'Enable Publish Mode': True})
+    # Only flip actors that expose the flag and don't have it set yet;
+    # the same subset is all the restore pass needs to write back.
+    to_restore = {
+        actor: props
+        for actor, props in backup_enable_publish_mode.items()
+        if props.get('Enable Publish Mode', True) is not True
+    }
+    set_properties(to_restore, {'Enable Publish Mode': True})
 
     if bake:
         data = save_state_and_bake(bindings)
@@ -1103,53 +1773,33 @@ def export_bindings_to_fbx(filename, bindings, bake=True):
             export_option = unreal.AnimSeqExportOption()
             export_option.record_in_world_space = True
 
-            world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+            world = _editor_world()
             sequence = binding.sequence
 
-            anim_sequence_asset_path = "/Game"
-            anim_sequence_asset_name = "__tmp_anim_seq__"
-
-            anim_sequence = unreal.AssetToolsHelpers.get_asset_tools().create_asset(anim_sequence_asset_name, anim_sequence_asset_path, unreal.AnimSequence, None)
-            unreal.log(f"Create temp AnimSequence asset '{anim_sequence_asset_path}/{anim_sequence_asset_name}'")
-            try:
+            with _tmp_anim_lock:
+                anim_sequence = _tmp_anim_sequence()
                 result = unreal.SequencerTools().export_anim_sequence(world, sequence, anim_sequence, export_option, binding, create_link=False)
-                unreal.log(f"Bake '{name}' into temp AnimSequence asset'{anim_sequence_asset_path}/{anim_sequence_asset_name}'")
+                unreal.log(f"Bake '{name}' into temp AnimSequence asset'{_TMP_ANIM_SEQ}'")
                 if result:
                     export_asset_to_fbx(filename, anim_sequence)
-            finally:
-                unreal.get_editor_subsystem(unreal.EditorAssetSubsystem).delete_asset(f"{anim_sequence_asset_path}/{anim_sequence_asset_name}")
-                unreal.log(f"Delete temp AnimSequence asset '{anim_sequence_asset_path}/{anim_sequence_asset_name}'")
 
         else:
             params = unreal.SequencerExportFBXParams()
-            params.world = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem).get_editor_world()
+            params.world = _editor_world()
 
             params.sequence = bindings[0].sequence
             params.bindings = bindings
             params.fbx_file_name = filename        # the filename to export as
 
             # Setup export options for the export task
-            params.override_options = unreal.FbxExportOption()
-            params.override_options.collision = False
-            params.override_options.bake_camera_and_light_animation = unreal.MovieSceneBakeType.BAKE_ALL
-            params.override_options.bake_actor_animation = unreal.MovieSceneBakeType.BAKE_ALL
-            params.override_options.level_of_detail = False
-            # These are the default options for the FBX export
-            # params.override_options.fbx_export_compatibility = fbx_2013
-            # params.override_options.ascii = False
-            # params.override_options.force_front_x_axis = False
-            # params.override_options.vertex_color = True
-            # params.override_options.level_of_detail = True
-
-            # params.override_options.welded_vertices = True
-            # params.override_options.map_skeletal_motion_to_root = False
+            params.override_options = _fbx_export_option()
 
             result = unreal.SequencerTools().export_level_sequence_fbx(params)
 
     finally:
         if bake:
             restore_state_after_bake(data)
-        restore_properties(backup_enable_publish_mode)
+        restore_properties(to_restore)
 
     if not result:
         unreal.log_error(f"Failed to export {filename}")
@@ -1158,10 +1808,17 @@ def export_bindings_to_fbx(filename, bindings, bake=True):
     return result
 
 
-def create_material_instance(parent_material_path, path, name):
-    asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+@functools.lru_cache(maxsize=64)
+def _load_parent_material(parent_material_path):
+    # Instances of the same parent are created in batches; one load
+    # covers them all.
+    return unreal.EditorAssetLibrary.load_asset(parent_material_path)
+
+
+def create_material_instance(parent_material_path, path, name, save=True):
+    asset_tools = _asset_tools()
 
-    parent_material = unreal.EditorAssetLibrary.load_asset(parent_material_path)
+    parent_material = _load_parent_material(parent_material_path)
     if not parent_material:
         unreal.log_error(f"Failed to load parent material: {parent_material_path}")
         return
@@ -1173,6 +1830,9 @@ def create_material_instance(parent_material_path, path, name):
         factory=unreal.MaterialInstanceConstantFactoryNew()
     )
     unreal.MaterialEditingLibrary.set_material_instance_parent(material_instance, parent_material)
-    unreal.EditorAssetLibrary.save_asset(f"{path}/{name}")
+    if save:
+        # Batch callers can pass save=False and flush once at the end
+        # with unreal.EditorAssetLibrary.save_directory(path)
+        unreal.EditorAssetLibrary.save_asset(f"{path}/{name}")
     unreal.log(f"Material Instance '{name}' created and saved at '{path}'")
-    material_instance
+    return material_instance
@@ -6,20 +6,44 @@ import unreal
 import sgtk.platform
 from . import config
 import sys
-import os
+import functools
+import subprocess
+from collections import defaultdict
 
 unreal.log("Loading SG Engine for Unreal from {}".format(__file__))
 
-# Shotgun integration components were renamed to Shotgrid from UE5
+# Shotgun integration components were renamed to Shotgrid from UE5.
+# Probed once here; per-call hasattr walks the C++ binding lookup.
 if hasattr(unreal, "ShotgridEngine"):
     UESGEngine = unreal.ShotgridEngine
 else:
     UESGEngine = unreal.ShotgunEngine
 
+if hasattr(unreal, "ShotgridMenuItem"):
+    UESGMenuItem = unreal.ShotgridMenuItem
+else:
+    UESGMenuItem = unreal.ShotgunMenuItem
+
+# The attribute is not available anymore from UE 5.1
+_HAS_OBJECT_PATH = hasattr(unreal.AssetData, "object_path")
+
+# File manager launch command for this platform, resolved once at import
+_OPEN_CMD = {
+    "linux": ("xdg-open",),
+    "linux2": ("xdg-open",),
+    "darwin": ("open",),
+    "win32": ("explorer",),
+}.get(sys.platform)
+
+
+@functools.lru_cache(maxsize=None)
+def _subsys(cls):
+    # Subsystem pointers are process-stable, one C++ crossing per class
+    return unreal.get_editor_subsystem(cls)
+
 
 def get_selected_actors():
-    actor_system = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-    return actor_system.get_selected_level_actors()
+    return _subsys(unreal.EditorActorSubsystem).get_selected_level_actors()
 
 
 @unreal.uclass()
@@ -30,6 +54,12 @@ class ShotgunEngineWrapper(UESGEngine):
         Equivalent to __init__ but will also be called from C++
         """
         config.wrapper_instance = self
+        # Context URL memo, keyed by the selection it was derived from
+        self._ctx_url = None
+        self._ctx_url_key = None
+        # Categorized command wrappers, keyed by the registered commands
+        self._menu_cache = None
+        self._menu_cache_key = None
 
     # Shotgun integration components were renamed to Shotgrid from UE5
     # these new methods are not available in UE4, we provide backward
@@ -102,7 +132,7 @@ class ShotgunEngineWrapper(UESGEngine):
 
         # unreal.log("execute_command called for {0}".format(command_name))
         if command_name == "Publish rendered movies...":
-            unreal.get_editor_subsystem(unreal.EditorActorSubsystem).select_nothing()
+            _subsys(unreal.EditorActorSubsystem).select_nothing()
             unreal.LevelSequenceEditorBlueprintLibrary.empty_selection()
             command_name = "Publish..."
 
@@ -137,6 +167,15 @@ class ShotgunEngineWrapper(UESGEngine):
 
         return default_callback
 
+    def _selected_level_actors(self):
+        """
+        The actors the menu was invoked on, queried once per caller.
+        """
+        try:
+            return self.get_selected_actors()
+        except Exception:
+            return self.selected_actors
+
     def _get_context_url(self, engine):
         """
         Get the SG entity URL from the metadata of the selected asset, if present.
@@ -146,12 +185,19 @@ class ShotgunEngineWrapper(UESGEngine):
 
         # In case of multi-selection, use the first object in the list
         selected_asset = self.selected_assets[0] if self.selected_assets else None
-        try:
-            selected_actors = self.get_selected_actors()
-        except Exception:
-            selected_actors = self.selected_actors
+        selected_actors = self._selected_level_actors()
         selected_actor = selected_actors[0] if selected_actors else None
 
+        # A single menu click resolves the context more than once (the
+        # panel override and the command itself); reuse the URL while
+        # the selection it came from is unchanged.
+        key = (
+            self.object_path(selected_asset) if selected_asset else None,
+            selected_actor.get_path_name() if selected_actor else None,
+        )
+        if key == self._ctx_url_key:
+            return self._ctx_url
+
         loaded_asset = None
         if selected_asset:
             # Asset must be loaded to read the metadata from item
@@ -170,6 +216,8 @@ class ShotgunEngineWrapper(UESGEngine):
             if metadata_value:
                 url = metadata_value
 
+        self._ctx_url = url
+        self._ctx_url_key = key
         return url
 
     def _get_context(self, engine):
@@ -252,9 +300,7 @@ class ShotgunEngineWrapper(UESGEngine):
         :param asset_data: A :class:`AssetData` instance.
         :returns: A string.
         """
-        # The attribute is not available anymore from
-        # UE 5.1
-        if hasattr(asset_data, "object_path"):
+        if _HAS_OBJECT_PATH:
             return asset_data.object_path
         return "%s.%s" % (asset_data.package_name, asset_data.asset_name)
 
@@ -274,52 +320,61 @@ class ShotgunEngineWrapper(UESGEngine):
         # add contextual commands here so that they get enumerated in the next step
         self._start_contextual_menu(engine, menu_items)
 
-        # enumerate all items and create menu objects for them
-        cmd_items = []
-        for (cmd_name, cmd_details) in engine.commands.items():
-            cmd_items.append(AppCommand(cmd_name, cmd_details))
+        # The wrapping and categorization only depend on the registered
+        # commands, which rarely change between menu invocations; reuse
+        # them until the command set does.
+        cache_key = (id(engine), frozenset(engine.commands))
+        if cache_key == self._menu_cache_key:
+            context_cmds, by_key, commands_by_app = self._menu_cache
+        else:
+            # enumerate all items and create menu objects for them.
+            # Reverse index so each command resolves its app instance
+            # name with one dict hit instead of scanning engine.apps.
+            app_index = {id(obj): name for name, obj in engine.apps.items()}
+            cmd_items = []
+            for (cmd_name, cmd_details) in engine.commands.items():
+                cmd_items.append(AppCommand(cmd_name, cmd_details, app_index))
+
+            # one pass over the commands: categorize them and build the
+            # favourites index together instead of re-walking the list
+            context_cmds = []
+            by_key = {}
+            commands_by_app = defaultdict(list)
+            for cmd in cmd_items:
+                by_key.setdefault((cmd.get_app_instance_name(), cmd.name), cmd)
+                if cmd.type == "context_menu":
+                    context_cmds.append(cmd)
+                else:
+                    # normal menu; "Other Items" collects un-parented apps
+                    commands_by_app[cmd.app_name or "Other Items"].append(cmd)
+
+            self._menu_cache = (context_cmds, by_key, commands_by_app)
+            self._menu_cache_key = cache_key
 
         # add the other contextual commands in this section
-        for cmd in cmd_items:
-            if cmd.get_type() == "context_menu":
-                self._add_menu_item_from_command(menu_items, cmd)
+        for cmd in context_cmds:
+            self._add_menu_item_from_command(menu_items, cmd)
 
         # end the contextual menu
         self._add_menu_item(menu_items, "context_end")
 
         # now favourites
         for fav in engine.get_setting("menu_favourites", []):
-            app_instance_name = fav["app_instance"]
-            menu_name = fav["name"]
-            # scan through all menu items
-            for cmd in cmd_items:
-                if cmd.get_app_instance_name() == app_instance_name and cmd.name == menu_name:
-                    # found our match!
-                    self._add_menu_item_from_command(menu_items, cmd)
-                    # mark as a favourite item
-                    cmd.favourite = True
+            cmd = by_key.get((fav["app_instance"], fav["name"]))
+            if cmd is not None:
+                # found our match!
+                self._add_menu_item_from_command(menu_items, cmd)
+                # mark as a favourite item
+                cmd.favourite = True
 
         self._add_menu_item(menu_items, "separator")
 
-        # now go through all of the other menu items.
-        # separate them out into various sections
-        commands_by_app = {}
+        # now add all apps to main menu; query the selection once here
+        selected_actors = self._selected_level_actors()
+        self._add_app_menu(commands_by_app, menu_items,
+                           self._has_selection(selected_actors))
 
-        for cmd in cmd_items:
-            if cmd.get_type() != "context_menu":
-                # normal menu
-                app_name = cmd.get_app_name()
-                if app_name is None:
-                    # un-parented app
-                    app_name = "Other Items"
-                if app_name not in commands_by_app:
-                    commands_by_app[app_name] = []
-                commands_by_app[app_name].append(cmd)
-
-        # now add all apps to main menu
-        self._add_app_menu(commands_by_app, menu_items)
-
-        return menu_items
+        return self._materialize_menu_items(menu_items)
 
     def _add_menu_item_from_command(self, menu_items, command, title=None):
         """
@@ -329,26 +384,36 @@ class ShotgunEngineWrapper(UESGEngine):
             title = command.name
         self._add_menu_item(
             menu_items,
-            command.properties.get("type", "default"),
-            command.properties.get("short_name", command.name),
+            command.type,
+            command.short_name,
             title,
-            command.properties.get("description", "")
+            command.description
         )
 
     def _add_menu_item(self, menu_items, type, name="", title="", description=""):
         """
-        Adds a new Unreal SG MenuItem to the menu items.
+        Adds a new menu entry row to the menu items.
+
+        Rows stay plain tuples while the menu is being assembled; the UE
+        menu item objects are only allocated once at the end, in
+        _materialize_menu_items.
         """
-        # Shotgun integration components were renamed to Shotgrid from UE5
-        if hasattr(unreal, "ShotgridMenuItem"):
-            menu_item = unreal.ShotgridMenuItem()
-        else:
-            menu_item = unreal.ShotgunMenuItem()
-        menu_item.title = title
-        menu_item.name = name
-        menu_item.type = type
-        menu_item.description = description
-        menu_items.append(menu_item)
+        menu_items.append((type, name, title, description))
+
+    @staticmethod
+    def _materialize_menu_items(rows):
+        """
+        Converts the accumulated rows into Unreal SG MenuItems in one pass.
+        """
+        menu_items = []
+        for (type, name, title, description) in rows:
+            menu_item = UESGMenuItem()
+            menu_item.title = title
+            menu_item.name = name
+            menu_item.type = type
+            menu_item.description = description
+            menu_items.append(menu_item)
+        return menu_items
 
     def _start_contextual_menu(self, engine, menu_items):
         """
@@ -387,36 +452,26 @@ class ShotgunEngineWrapper(UESGEngine):
         """
         engine = sgtk.platform.current_engine()
 
-        # launch one window for each location on disk
+        if _OPEN_CMD is None:
+            raise Exception("Platform '%s' is not supported." % sys.platform)
+
+        # launch one window for each location on disk; fire-and-forget
+        # so the editor doesn't block on each file manager shell
         paths = engine.context.filesystem_locations
         for disk_location in paths:
-            # get the setting
-            system = sys.platform
-
-            # run the app
-            if system == "linux2":
-                cmd = 'xdg-open "%s"' % disk_location
-            elif system == "darwin":
-                cmd = 'open "%s"' % disk_location
-            elif system == "win32":
-                cmd = 'cmd.exe /C start "Folder" "%s"' % disk_location
-            else:
-                raise Exception("Platform '%s' is not supported." % system)
-
-            exit_code = os.system(cmd)
-            if exit_code != 0:
+            cmd = [*_OPEN_CMD, disk_location]
+            try:
+                subprocess.Popen(cmd, close_fds=True, start_new_session=True)
+            except OSError:
                 engine.log_error("Failed to launch '%s'!" % cmd)
 
-    def _add_app_menu(self, commands_by_app, menu_items):
+    def _has_selection(self, selected_actors=None):
         """
-        Add all apps to the main menu section, process them one by one.
-        :param commands_by_app: Dictionary of app name and commands related to the app, which
-                                will be added to the menu_items
+        Whether anything is selected: assets, actors or sequencer folders.
         """
-        try:
-            has_selected_actors = len(self.get_selected_actors()) > 0
-        except Exception:
-            has_selected_actors = len(self.selected_actors) > 0
+        if selected_actors is None:
+            selected_actors = self._selected_level_actors()
+        has_selected_actors = len(selected_actors) > 0
         sel_movie_folders = unreal.LevelSequenceEditorBlueprintLibrary.get_selected_folders()
         has_selection = len(self.selected_assets) > 0 or has_selected_actors or len(sel_movie_folders) > 0
 
@@ -424,8 +479,20 @@ class ShotgunEngineWrapper(UESGEngine):
             selected_actors = get_selected_actors()
             # unreal.log(selected_actors)
             has_selection = len(selected_actors) > 0
+        return has_selection
+
+    def _add_app_menu(self, commands_by_app, menu_items, has_selection=None):
+        """
+        Add all apps to the main menu section, process them one by one.
+        :param commands_by_app: Dictionary of app name and commands related to the app, which
+                                will be added to the menu_items
+        :param has_selection: Selection state computed once by the caller;
+                              queried here when not provided
+        """
+        if has_selection is None:
+            has_selection = self._has_selection()
 
-        for app_name in sorted(commands_by_app.keys()):
+        for app_name in sorted(commands_by_app):
             # Exclude the Publish app if it doesn't have any context
             if app_name == "Publish":
                 if not self.selected_assets:
@@ -458,39 +525,54 @@ class AppCommand(object):
     Wraps around a single command that you get from engine.commands
     """
 
-    def __init__(self, name, command_dict):
+    # Menus are rebuilt on every right-click; slots plus precomputed
+    # fields keep each wrapper small and its hot reads attribute loads.
+    __slots__ = ("name", "properties", "callback", "favourite", "_app_index",
+                 "type", "short_name", "description", "app_name")
+
+    def __init__(self, name, command_dict, app_index=None):
         """
         Initialize AppCommand object.
         :param name: Command name
         :param command_dict: Dictionary containing a 'callback' property to use as callback.
+        :param app_index: Optional {id(app instance): instance name} map
+                          built once per menu pass.
         """
         self.name = name
-        self.properties = command_dict["properties"]
+        properties = command_dict["properties"]
+        self.properties = properties
         self.callback = command_dict["callback"]
         self.favourite = False
+        self._app_index = app_index
+        self.type = properties.get("type", "default")
+        self.short_name = properties.get("short_name", name)
+        self.description = properties.get("description", "")
+        app = properties.get("app")
+        self.app_name = app.display_name if app is not None else None
 
     def get_app_name(self):
         """
         Returns the name of the app that this command belongs to
         """
-        if "app" in self.properties:
-            return self.properties["app"].display_name
-        return None
+        return self.app_name
 
     def get_app_instance_name(self):
         """
         Returns the name of the app instance, as defined in the environment.
         Returns None if not found.
         """
-        engine = self.get_engine()
-        if engine is None:
-            return None
-
         if "app" not in self.properties:
             return None
 
         app_instance = self.properties["app"]
 
+        if self._app_index is not None:
+            return self._app_index.get(id(app_instance))
+
+        engine = self.get_engine()
+        if engine is None:
+            return None
+
         for (app_instance_name, app_instance_obj) in engine.apps.items():
             if app_instance_obj == app_instance:
                 # found our app!
@@ -515,4 +597,4 @@ class AppCommand(object):
         """
         returns the command type. Returns node, custom_pane or default.
         """
-        return self.properties.get("type", "default")
+        return self.type